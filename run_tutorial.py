@@ -57,6 +57,13 @@ Examples:
         default='test',
         help='Namespace to use (default: test)'
     )
+    parser.add_argument(
+        '--services-alternate',
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help='Discover nodes via alternate-access addresses, as AeroLab on Docker '
+             'needs (default: on; use --no-services-alternate for direct access)'
+    )
     parser.add_argument(
         '--skip-sc-check',
         action='store_true',
@@ -69,7 +76,8 @@ Examples:
     tutorial = StrongConsistencyTutorial(
         hosts=[(args.host, args.port)],
         namespace=args.namespace,
-        interactive=not args.non_interactive
+        interactive=not args.non_interactive,
+        services_alternate=args.services_alternate
     )
     
     # If only running lesson 0 (setup), skip SC check
@@ -1,13 +1,17 @@
 """Cluster management components."""
 
-from .shell import detect_aerolab_container, open_aql_shell, open_asadm_shell, run_asinfo_command
-from .validation import ClusterValidator
+from .shell import clear_container_cache, detect_aerolab_container, open_aql_shell, open_asadm_shell, run_asinfo_command
+from .validation import ClusterEpoch, ClusterValidator, invalidate_sc_info_cache, parse_namespace_info
 
 __all__ = [
+    'clear_container_cache',
     'detect_aerolab_container',
     'open_aql_shell', 
     'open_asadm_shell',
     'run_asinfo_command',
-    'ClusterValidator'
+    'ClusterEpoch',
+    'ClusterValidator',
+    'invalidate_sc_info_cache',
+    'parse_namespace_info'
 ]
 
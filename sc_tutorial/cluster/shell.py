@@ -1,16 +1,47 @@
 """Shell interaction utilities for AQL and ASADM."""
 
 import subprocess
+import time
+from ..config import CONTAINER_CACHE_TTL
 from ..ui.colors import Colors
 from ..ui.display import print_warning, print_info, print_code
 
+# (expiry, container_name) of the last successful detection
+_container_cache = None
+
+# Seconds to wait on `docker ps` before treating the daemon as unavailable
+_DETECT_TIMEOUT = 2
+
+
+def clear_container_cache():
+    """Forget the cached AeroLab container name."""
+    global _container_cache
+    _container_cache = None
+
 
 def detect_aerolab_container():
-    """Detect running AeroLab container name."""
+    """Detect running AeroLab container name.
+    
+    A found name is reused for CONTAINER_CACHE_TTL seconds to avoid running
+    `docker ps` on every menu and validation call.
+    """
+    global _container_cache
+    now = time.monotonic()
+    if _container_cache is not None and now < _container_cache[0]:
+        return _container_cache[1]
+    
+    name = _find_aerolab_container()
+    if name:
+        _container_cache = (now + CONTAINER_CACHE_TTL, name)
+    return name
+
+
+def _find_aerolab_container():
+    """Run `docker ps` and return the first AeroLab container name."""
     try:
         result = subprocess.run(
             ['docker', 'ps', '--format', '{{.Names}}'],
-            capture_output=True, text=True, timeout=5
+            capture_output=True, text=True, timeout=_DETECT_TIMEOUT
         )
         for name in result.stdout.strip().split('\n'):
             if name.startswith('aerolab-'):
@@ -33,10 +64,12 @@ def open_aql_shell(container_name=None, namespace='test'):
         
         try:
             # Use -Uadmin with no password for default AeroLab setup
-            subprocess.run(
+            result = subprocess.run(
                 ['docker', 'exec', '-it', container_name, 'aql'],
                 check=False
             )
+            if result.returncode != 0:
+                clear_container_cache()  # Container may have gone away
         except KeyboardInterrupt:
             pass
         print(f"\n{Colors.GREEN}Returned to tutorial.{Colors.ENDC}")
@@ -58,10 +91,12 @@ def open_asadm_shell(container_name=None):
         print(f"{Colors.CYAN}{'='*60}{Colors.ENDC}\n")
         
         try:
-            subprocess.run(
+            result = subprocess.run(
                 ['docker', 'exec', '-it', container_name, 'asadm'],
                 check=False
             )
+            if result.returncode != 0:
+                clear_container_cache()  # Container may have gone away
         except KeyboardInterrupt:
             pass
         print(f"\n{Colors.GREEN}Returned to tutorial.{Colors.ENDC}")
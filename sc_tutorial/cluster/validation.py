@@ -1,9 +1,148 @@
 """Cluster health validation utilities."""
 
+import contextlib
+import functools
+import io
+import re
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Optional
+
+from aerospike import exception as ae_exception
+
+from ..config import SC_INFO_CACHE_TTL, SC_INFO_MAX_STALE, FULL_VALIDATE_TTL
 from ..ui.colors import Colors
 from ..ui.display import print_success, print_error, print_warning, print_info, print_code
 from .shell import detect_aerolab_container, run_asinfo_command
 
+# Pre-rendered report headers
+_RULE = f"{Colors.CYAN}{'=' * 60}{Colors.ENDC}"
+_BANNER = f"\n{_RULE}\n{Colors.CYAN}           CLUSTER HEALTH CHECK{Colors.ENDC}\n{_RULE}\n"
+_SUMMARY_RULE = f"\n{_RULE}"
+_FOOTER_RULE = f"{_RULE}\n"
+_STEP_CONNECTION = f"{Colors.BOLD}1. Checking connection...{Colors.ENDC}"
+_STEP_SC = f"\n{Colors.BOLD}2. Checking Strong Consistency status...{Colors.ENDC}"
+_STEP_PARTITIONS = f"\n{Colors.BOLD}3. Checking partition health...{Colors.ENDC}"
+_STEP_ROSTER = f"\n{Colors.BOLD}4. Checking roster configuration...{Colors.ENDC}"
+
+# Matches one key=value pair of a ';'-separated info response
+_KV_RE = re.compile(r'([^=;]+)=([^;]*)')
+
+# Namespace info fields read by verify_sc_enabled()
+_SC_INFO_FIELDS = frozenset({
+    'strong-consistency',
+    'replication-factor',
+    'ns_cluster_size',
+    'dead_partitions',
+    'unavailable_partitions',
+})
+
+# (client, namespace) -> (expiry, epoch, sc_enabled, info)
+_sc_info_cache = {}
+
+# Background refreshes for stale cache entries; one in flight per cache key
+_refresh_lock = threading.Lock()
+_refresh_pool = None
+_refresh_inflight = {}
+
+
+class ClusterEpoch:
+    """Counter bumped whenever roster or SC state may have been changed.
+    
+    Cached namespace info records the epoch it was fetched in and is ignored
+    once the epoch moves on, so a single bump invalidates every cache entry
+    (including results of refreshes that were already in flight).
+    """
+    
+    _value = 0
+    _lock = threading.Lock()
+    
+    @classmethod
+    def bump(cls):
+        """Advance the epoch and return the new value."""
+        with cls._lock:
+            cls._value += 1
+            return cls._value
+    
+    @classmethod
+    def current(cls):
+        """Return the current epoch."""
+        return cls._value
+
+
+def invalidate_sc_info_cache():
+    """Invalidate cached namespace info, e.g. after roster or SC state changes."""
+    ClusterEpoch.bump()
+
+
+def _parse_info_fields(result, fields):
+    """Extract the wanted key=value pairs from an info response.
+    
+    Stops scanning as soon as every field in `fields` has been seen.
+    """
+    params = {}
+    for match in _KV_RE.finditer(result):
+        key = match.group(1)
+        if key in fields:
+            params[key] = match.group(2)
+            if len(params) == len(fields):
+                break
+    return params
+
+
+def parse_namespace_info(info):
+    """Return the SC-related key=value fields of a namespace info response.
+    
+    Values are left as the raw strings the server sent; fields missing from
+    the response are missing from the dict.
+    """
+    return _parse_info_fields(info, _SC_INFO_FIELDS)
+
+
+def _split_info_results(result):
+    """Split a multi-command info response into a dict of command -> result."""
+    results = {}
+    for line in result.split('\n'):
+        command, sep, value = line.partition('\t')
+        if sep:
+            results[command] = value
+    return results
+
+
+def _count_roster_nodes(roster_info):
+    """Count node IDs in the `roster=` field of a roster info response."""
+    # Skip matches inside other fields such as pending_roster=
+    idx = roster_info.find('roster=')
+    while idx > 0 and roster_info[idx - 1] != ':':
+        idx = roster_info.find('roster=', idx + 1)
+    if idx < 0:
+        return 0
+    
+    start = idx + len('roster=')
+    end = roster_info.find(':', start)
+    if end < 0:
+        end = len(roster_info)
+    if start == end or roster_info.startswith('null', start):
+        return 0
+    return roster_info.count(',', start, end) + 1
+
+
+def _schedule_refresh(cache_key, fetch):
+    """Run fetch() in the background unless a refresh for cache_key is already running."""
+    global _refresh_pool
+    with _refresh_lock:
+        pending = _refresh_inflight.get(cache_key)
+        if pending is not None and not pending.done():
+            return pending
+        if _refresh_pool is None:
+            _refresh_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='sc-info')
+        future = _refresh_pool.submit(fetch)
+        _refresh_inflight[cache_key] = future
+        return future
+
 
 class ClusterValidator:
     """Handles cluster health validation."""
@@ -11,183 +150,313 @@ class ClusterValidator:
     def __init__(self, client, namespace):
         self.client = client
         self.namespace = namespace
+        # (timestamp, epoch, HealthReport) of the last compact check
+        self._last_compact = None
+        # (timestamp, epoch, rendered text, healthy) of the last full check
+        self._last_full = None
     
-    def verify_sc_enabled(self):
-        """Check if the namespace has Strong Consistency enabled."""
+    def verify_sc_enabled(self, force=False, stale_ok=False):
+        """Check if the namespace has Strong Consistency enabled.
+        
+        Results are cached for SC_INFO_CACHE_TTL seconds so repeated compact
+        status checks don't query every node. Pass force=True to bypass.
+        With stale_ok=True a result that expired less than SC_INFO_MAX_STALE
+        seconds ago is returned immediately and a refresh is started in the
+        background for the next caller; anything older is fetched inline.
+        """
         if not self.client:
             return False, "Not connected"
         
+        cache_key = (self.client, self.namespace)
+        epoch = ClusterEpoch.current()
+        if not force:
+            cached = _sc_info_cache.get(cache_key)
+            if cached is not None and cached[1] == epoch:
+                now = time.monotonic()
+                if now < cached[0]:
+                    return cached[2], cached[3]
+                if stale_ok and now < cached[0] + SC_INFO_MAX_STALE:
+                    _schedule_refresh(cache_key, lambda: self.verify_sc_enabled(force=True))
+                    return cached[2], cached[3]
+        
+        sc_enabled, info = self._fetch_sc_status()
+        if isinstance(info, dict):
+            _sc_info_cache[cache_key] = (time.monotonic() + SC_INFO_CACHE_TTL, epoch, sc_enabled, info)
+        return sc_enabled, info
+    
+    def _iter_info_responses(self, request):
+        """Yield raw info responses for request, cheapest source first.
+        
+        A single random node is asked first; info_all() (which waits on every
+        node) is only called if that response is missing or unusable.
+        """
         try:
-            import aerospike
-            from aerospike import exception as ae_exception
-            
-            # Get namespace info
-            info_cmd = f"namespace/{self.namespace}"
-            response = self.client.info_all(info_cmd)
-            
-            for node, (err, result) in response.items():
-                if err is None and result:
-                    params = dict(item.split('=') for item in result.split(';') if '=' in item)
-                    sc_enabled = params.get('strong-consistency', 'false') == 'true'
-                    dead_partitions = int(params.get('dead_partitions', 0))
-                    unavail_partitions = int(params.get('unavailable_partitions', 0))
-                    ns_cluster_size = int(params.get('ns_cluster_size', 0))
-                    
-                    return sc_enabled, {
-                        'strong_consistency': sc_enabled,
-                        'dead_partitions': dead_partitions,
-                        'unavailable_partitions': unavail_partitions,
-                        'ns_cluster_size': ns_cluster_size,
-                        'replication_factor': params.get('replication-factor', 'N/A')
-                    }
-            
-            return False, "Could not get namespace info"
-            
+            result = self.client.info_random_node(request)
+            if result:
+                yield result
+        except ae_exception.AerospikeError:
+            pass
+        
+        try:
+            response = self.client.info_all(request)
+        except ae_exception.AerospikeError:
+            return
+        for node, (err, result) in response.items():
+            if err is None and result:
+                yield result
+    
+    def _parse_sc_status(self, result):
+        """Parse a namespace info response into (sc_enabled, info).
+        
+        A response without a strong-consistency field (e.g. an unknown
+        namespace) reports SC as disabled with zeroed stats.
+        
+        Raises:
+            ValueError: If the response is missing or empty.
+        """
+        if not result:
+            raise ValueError("empty namespace info response")
+        params = parse_namespace_info(result)
+        
+        sc_enabled = params.get('strong-consistency', 'false') == 'true'
+        return sc_enabled, {
+            'strong_consistency': sc_enabled,
+            'dead_partitions': int(params.get('dead_partitions', 0)),
+            'unavailable_partitions': int(params.get('unavailable_partitions', 0)),
+            'ns_cluster_size': int(params.get('ns_cluster_size', 0)),
+            'replication_factor': params.get('replication-factor', 'N/A'),
+            'roster': None
+        }
+    
+    def _fetch_sc_status(self):
+        """Query namespace and roster info from the cluster."""
+        # Get namespace and roster info in a single info request
+        info_cmd = f"namespace/{self.namespace}"
+        roster_cmd = f"roster:namespace={self.namespace}"
+        request = f"{info_cmd}\n{roster_cmd}\n"
+        
+        try:
+            # Use the first node that answered; skip empty responses
+            for response in self._iter_info_responses(request):
+                results = _split_info_results(response)
+                try:
+                    sc_enabled, info = self._parse_sc_status(results.get(info_cmd))
+                except ValueError:
+                    continue
+                info['roster'] = results.get(roster_cmd)
+                return sc_enabled, info
         except Exception as e:
             return False, str(e)
+        
+        return False, "Could not get namespace info"
     
-    def validate(self, compact=False):
+    def _get_roster_info(self):
+        """Return (container, roster info string) via the AeroLab container."""
+        container = detect_aerolab_container()
+        if not container:
+            return None, None
+        return container, run_asinfo_command(container, f"roster:namespace={self.namespace}")
+    
+    def validate(self, compact=False, max_age=None):
         """Validate cluster health and help fix any issues.
         
         Args:
             compact: If True, show brief one-line status. If False, show full details.
+            max_age: For compact checks, reuse the previous result if it is
+                younger than this many seconds and the cluster epoch is unchanged.
+                Full checks always replay a report under FULL_VALIDATE_TTL old.
         
         Returns:
             True if cluster is healthy, False otherwise.
         """
-        import aerospike
-        from aerospike import exception as ae_exception
-        
-        issues_found = False
-        info = {}
+        if compact:
+            report = None
+            epoch = ClusterEpoch.current()
+            now = time.monotonic()
+            last = self._last_compact
+            if max_age is not None and last is not None and last[1] == epoch and now - last[0] < max_age:
+                report = last[2]
+            if report is None:
+                report = self._collect(compact)
+                self._last_compact = (now, epoch, report)
+            print(_render_compact(report))
+            return report.healthy
         
+        self._last_compact = None
+        epoch = ClusterEpoch.current()
+        now = time.monotonic()
+        last = self._last_full
+        if last is not None and last[1] == epoch and now - last[0] < FULL_VALIDATE_TTL:
+            # Repeated 'v' presses replay the report instead of re-querying
+            _, _, text, healthy = last
+        else:
+            report = self._collect(compact)
+            # Render the full report into one buffer and write it in a single call
+            buf = io.StringIO()
+            with contextlib.redirect_stdout(buf):
+                self._print_report(report)
+            text, healthy = buf.getvalue(), report.healthy
+            self._last_full = (now, epoch, text, healthy)
+        sys.stdout.write(text)
+        sys.stdout.flush()
+        return healthy
+    
+    def _collect(self, compact):
+        """Gather cluster state for validate() without printing anything."""
         # Check 1: Connection
         if not self.client:
-            if compact:
-                print_error("❌ Not connected to cluster!")
-            else:
-                print(f"\n{Colors.CYAN}{'='*60}{Colors.ENDC}")
-                print(f"{Colors.CYAN}           CLUSTER HEALTH CHECK{Colors.ENDC}")
-                print(f"{Colors.CYAN}{'='*60}{Colors.ENDC}\n")
-                print(f"{Colors.BOLD}1. Checking connection...{Colors.ENDC}")
-                print_error("Not connected to cluster!")
-            return False
-        else:
-            # Test connection with a simple operation
-            try:
-                self.client.get_nodes()
-            except ae_exception.AerospikeError as e:
-                if compact:
-                    print_error(f"❌ Connection issue: {e}")
-                else:
-                    print_error(f"Connection issue: {e}")
-                return False
-        
-        # Get SC status
-        sc_enabled, info = self.verify_sc_enabled()
-        
-        # Check for issues
-        if isinstance(info, dict):
-            dead = info.get('dead_partitions', 0)
-            unavail = info.get('unavailable_partitions', 0)
-            if dead > 0 or unavail > 0 or not sc_enabled:
-                issues_found = True
-        else:
-            issues_found = True
+            return HealthReport(connection_error="Not connected to cluster!")
         
-        if compact:
-            # Show compact one-line status
-            if issues_found:
-                status_parts = []
-                if not sc_enabled:
-                    status_parts.append("SC disabled")
-                if isinstance(info, dict):
-                    if info.get('dead_partitions', 0) > 0:
-                        status_parts.append(f"dead={info['dead_partitions']}")
-                    if info.get('unavailable_partitions', 0) > 0:
-                        status_parts.append(f"unavail={info['unavailable_partitions']}")
-                print(f"\n{Colors.YELLOW}⚠ Cluster Status: {', '.join(status_parts)} [press 'v' for details]{Colors.ENDC}")
-            else:
-                rf = info.get('replication_factor', '?') if isinstance(info, dict) else '?'
-                ns_size = info.get('ns_cluster_size', '?') if isinstance(info, dict) else '?'
-                print(f"\n{Colors.GREEN}✓ Cluster OK: SC=enabled, RF={rf}, nodes={ns_size}, partitions=healthy{Colors.ENDC}")
-            return not issues_found
+        # Test connection with a simple operation
+        try:
+            self.client.get_nodes()
+        except ae_exception.AerospikeError as e:
+            return HealthReport(connection_error=f"Connection issue: {e}")
+        
+        # Get SC status (compact checks may reuse a recent result)
+        sc_enabled, info = self.verify_sc_enabled(force=not compact, stale_ok=compact)
+        
+        # The compact status line doesn't cover the roster
+        roster_info = None
+        if not compact:
+            # The roster normally arrives with the namespace info; only fall
+            # back to asinfo inside the AeroLab container if the client didn't
+            if isinstance(info, dict):
+                roster_info = info.get('roster')
+            if roster_info is None:
+                _, roster_info = self._get_roster_info()
         
-        # Full detailed output
-        print(f"\n{Colors.CYAN}{'='*60}{Colors.ENDC}")
-        print(f"{Colors.CYAN}           CLUSTER HEALTH CHECK{Colors.ENDC}")
-        print(f"{Colors.CYAN}{'='*60}{Colors.ENDC}\n")
+        if not isinstance(info, dict):
+            return HealthReport(info_error=info, roster=roster_info)
+        
+        return HealthReport(
+            sc_enabled=sc_enabled,
+            dead_partitions=info.get('dead_partitions', 0),
+            unavailable_partitions=info.get('unavailable_partitions', 0),
+            replication_factor=info.get('replication_factor', 'N/A'),
+            ns_cluster_size=info.get('ns_cluster_size', 0),
+            roster=roster_info,
+        )
+    
+    def _print_report(self, report):
+        """Print the detailed health report."""
+        print(_BANNER)
         
         # Check 1: Connection
-        print(f"{Colors.BOLD}1. Checking connection...{Colors.ENDC}")
+        print(_STEP_CONNECTION)
+        if report.connection_error:
+            print_error(report.connection_error)
+            return
         print_success("Connection OK")
         
         # Check 2: SC enabled
-        print(f"\n{Colors.BOLD}2. Checking Strong Consistency status...{Colors.ENDC}")
-        if sc_enabled:
+        print(_STEP_SC)
+        if report.sc_enabled:
             print_success(f"Strong Consistency: ENABLED")
-            print(f"   ├── Replication Factor: {info.get('replication_factor', 'N/A')}")
-            print(f"   └── NS Cluster Size: {info.get('ns_cluster_size', 'N/A')}")
+            print(f"   ├── Replication Factor: {report.replication_factor}")
+            print(f"   └── NS Cluster Size: {report.ns_cluster_size}")
         else:
             print_error("Strong Consistency: NOT ENABLED or namespace not found")
             print_info(f"Make sure namespace '{self.namespace}' has strong-consistency=true")
         
         # Check 3: Partitions
-        print(f"\n{Colors.BOLD}3. Checking partition health...{Colors.ENDC}")
-        if isinstance(info, dict):
-            dead = info.get('dead_partitions', 0)
-            unavail = info.get('unavailable_partitions', 0)
-            
-            if dead > 0:
-                print_error(f"Dead partitions: {dead}")
+        print(_STEP_PARTITIONS)
+        if report.info_error is None:
+            if report.dead_partitions > 0:
+                print_error(f"Dead partitions: {report.dead_partitions}")
                 print_warning("Dead partitions indicate potential data loss!")
                 print_info("To revive dead partitions (if acceptable):")
                 print_code(f"asinfo -v 'revive:namespace={self.namespace}'")
             else:
                 print_success("Dead partitions: 0")
             
-            if unavail > 0:
-                print_warning(f"Unavailable partitions: {unavail}")
+            if report.unavailable_partitions > 0:
+                print_warning(f"Unavailable partitions: {report.unavailable_partitions}")
                 print_info("Some partitions are temporarily unavailable.")
                 print_info("This usually resolves when all roster nodes rejoin.")
             else:
                 print_success("Unavailable partitions: 0")
         
         # Check 4: Roster
-        print(f"\n{Colors.BOLD}4. Checking roster configuration...{Colors.ENDC}")
-        container = detect_aerolab_container()
-        roster_ok = True
-        if container:
-            roster_info = run_asinfo_command(container, f"roster:namespace={self.namespace}")
-            if 'roster=null' in roster_info or 'roster=' not in roster_info:
+        print(_STEP_ROSTER)
+        if report.roster is not None:
+            if not report.roster_ok:
                 print_warning("Roster may not be properly configured")
                 print_info("To configure roster:")
                 print_code(f"aerolab conf sc -n <cluster_name>")
                 print_info("Or manually:")
                 print_code(f"asadm> manage roster stage observed ns {self.namespace}")
                 print_code("asadm> manage recluster")
-                roster_ok = False
             else:
                 print_success("Roster configured")
                 # Parse and show roster summary
-                if 'observed_nodes=' in roster_info:
-                    parts = roster_info.split(':')
-                    for part in parts:
-                        if part.startswith('roster='):
-                            roster_val = part.split('=')[1]
-                            node_count = len(roster_val.split(',')) if roster_val and roster_val != 'null' else 0
-                            print(f"   └── Roster nodes: {node_count}")
+                if 'observed_nodes=' in report.roster:
+                    print(f"   └── Roster nodes: {_count_roster_nodes(report.roster)}")
         else:
-            print_warning("Could not detect AeroLab container for roster check")
+            print_warning("Could not get roster info (no AeroLab container detected)")
         
         # Summary
-        print(f"\n{Colors.CYAN}{'='*60}{Colors.ENDC}")
-        if issues_found or not roster_ok:
+        print(_SUMMARY_RULE)
+        if not report.healthy:
             print_warning("Issues found! Please address them before continuing.")
             print_info("You can open ASADM shell (option 's') to investigate further.")
         else:
             print_success("All checks passed! Cluster is healthy.")
-        print(f"{Colors.CYAN}{'='*60}{Colors.ENDC}\n")
-        
-        return not issues_found and roster_ok
+        print(_FOOTER_RULE)
+
+
+@dataclass(frozen=True)
+class HealthReport:
+    """Snapshot of cluster health gathered by ClusterValidator.validate()."""
+    
+    connection_error: Optional[str] = None
+    info_error: Optional[str] = None
+    sc_enabled: bool = False
+    dead_partitions: int = 0
+    unavailable_partitions: int = 0
+    replication_factor: str = 'N/A'
+    ns_cluster_size: int = 0
+    roster: Optional[str] = None
+    
+    @property
+    def issues_found(self):
+        """True if SC is off, info is missing or any partition is dead/unavailable."""
+        return (
+            self.info_error is not None
+            or not self.sc_enabled
+            or self.dead_partitions > 0
+            or self.unavailable_partitions > 0
+        )
+    
+    @property
+    def roster_ok(self):
+        """False only if a roster was fetched and it is empty."""
+        if self.roster is None:
+            return True
+        return 'roster=null' not in self.roster and 'roster=' in self.roster
+    
+    @property
+    def healthy(self):
+        """True if every check passed."""
+        return self.connection_error is None and not self.issues_found and self.roster_ok
+
 
+@functools.lru_cache(maxsize=8)
+def _render_compact(report):
+    """Render the one-line status for a report (cached, since it rarely changes)."""
+    if report.connection_error:
+        return f"{Colors.RED}✗ ❌ {report.connection_error}{Colors.ENDC}"
+    
+    if report.issues_found:
+        status_parts = []
+        if not report.sc_enabled:
+            status_parts.append("SC disabled")
+        if report.dead_partitions > 0:
+            status_parts.append(f"dead={report.dead_partitions}")
+        if report.unavailable_partitions > 0:
+            status_parts.append(f"unavail={report.unavailable_partitions}")
+        return f"\n{Colors.YELLOW}⚠ Cluster Status: {', '.join(status_parts)} [press 'v' for details]{Colors.ENDC}"
+    
+    rf = report.replication_factor
+    ns_size = report.ns_cluster_size
+    return f"\n{Colors.GREEN}✓ Cluster OK: SC=enabled, RF={rf}, nodes={ns_size}, partitions=healthy{Colors.ENDC}"
@@ -1,6 +1,13 @@
 """Command suggestion system."""
 
-from .suggested import show_suggested_commands, LESSON_COMMANDS
+from .suggested import show_suggested_commands
 
 __all__ = ['show_suggested_commands', 'LESSON_COMMANDS']
 
+
+def __getattr__(name):
+    # Forward lazily so the command table is only built when first used
+    if name == 'LESSON_COMMANDS':
+        from . import suggested
+        return suggested.LESSON_COMMANDS
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -11,6 +11,34 @@ DEFAULT_SET = 'tutorial'
 # Timeout settings
 CONNECTION_TIMEOUT = 5000
 
+# Socket connect timeout (ms); kept short so an unreachable seed fails fast
+CONNECT_TIMEOUT = 1000
+
+# Connection pool per node; the minimum covers the concurrent-writes lesson's
+# worker threads plus the health checks so no lesson opens sockets on demand
+MIN_CONNS_PER_NODE = 8
+MAX_CONNS_PER_NODE = 100
+
+# Write policy for deletes in SC namespaces (leaves a tombstone). Passed to the
+# client as-is, so treat it as read-only; the client requires a real dict.
+DURABLE_DELETE_POLICY = {'durable_delete': True}
+
+# How long (seconds) namespace info from verify_sc_enabled() is reused
+SC_INFO_CACHE_TTL = 1.0
+
+# How long (seconds) past expiry cached namespace info may still be shown
+# while a background refresh runs; older entries are re-fetched synchronously
+SC_INFO_MAX_STALE = 5.0
+
+# How long (seconds) a detected AeroLab container name is reused
+CONTAINER_CACHE_TTL = 30.0
+
+# How long (seconds) a lesson pause reuses the last compact health check
+PAUSE_VALIDATE_TTL = 5.0
+
+# How long (seconds) a full health report is replayed instead of re-collected
+FULL_VALIDATE_TTL = 1.0
+
 # =============================================================================
 # CONCEPT TEXT CONTENT
 # =============================================================================
@@ -1,17 +1,24 @@
 """Tutorial lessons."""
 
-from .lesson_0_aerolab import LessonAerolab
-from .lesson_1_intro import LessonIntroduction
-from .lesson_2_config import LessonConfiguration
-from .lesson_3_basic_ops import LessonBasicOperations
-from .lesson_4_consistency import LessonConsistency
-from .lesson_5_concurrent import LessonConcurrentWrites
-from .lesson_6_generation import LessonGeneration
-from .lesson_7_errors import LessonErrorHandling
-from .lesson_8_cluster import LessonClusterBehavior
-from .lesson_9_best_practices import LessonBestPractices
+import importlib
+
+# Name -> defining module; modules are imported on first access
+_LESSON_MODULES = {
+    'LessonContext': '.base',
+    'LessonAerolab': '.lesson_0_aerolab',
+    'LessonIntroduction': '.lesson_1_intro',
+    'LessonConfiguration': '.lesson_2_config',
+    'LessonBasicOperations': '.lesson_3_basic_ops',
+    'LessonConsistency': '.lesson_4_consistency',
+    'LessonConcurrentWrites': '.lesson_5_concurrent',
+    'LessonGeneration': '.lesson_6_generation',
+    'LessonErrorHandling': '.lesson_7_errors',
+    'LessonClusterBehavior': '.lesson_8_cluster',
+    'LessonBestPractices': '.lesson_9_best_practices',
+}
 
 __all__ = [
+    'LessonContext',
     'LessonAerolab',
     'LessonIntroduction', 
     'LessonConfiguration',
@@ -24,3 +31,11 @@ __all__ = [
     'LessonBestPractices',
 ]
 
+
+def __getattr__(name):
+    module_name = _LESSON_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    lesson_class = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = lesson_class
+    return lesson_class
@@ -1,8 +1,27 @@
 """Base class for tutorial lessons."""
 
-from ..ui.display import print_banner, print_section, print_concept
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from aerospike_helpers.operations import operations as ops
+
+from ..ui.display import print_banner, print_section, print_concept, print_warning
 from ..ui.menu import interactive_menu
 from ..cluster.validation import ClusterValidator
+from ..config import PAUSE_VALIDATE_TTL
+
+
+@dataclass(frozen=True)
+class LessonContext:
+    """Session state shared by every lesson in a tutorial run."""
+    
+    client: Any
+    namespace: str
+    set_name: str
+    interactive: bool = True
+    validator: Optional[ClusterValidator] = None
+    # Demo records to delete at teardown
+    cleanup_keys: list = field(default_factory=list)
 
 
 class BaseLesson:
@@ -11,12 +30,14 @@ class BaseLesson:
     lesson_name = 'basic_ops'  # Override in subclasses
     lesson_title = 'LESSON'    # Override in subclasses
     
-    def __init__(self, client, namespace, set_name, interactive=True):
-        self.client = client
-        self.namespace = namespace
-        self.set_name = set_name
-        self.interactive = interactive
-        self.validator = ClusterValidator(client, namespace)
+    def __init__(self, context):
+        self.context = context
+        self.client = context.client
+        self.namespace = context.namespace
+        self.set_name = context.set_name
+        self.interactive = context.interactive
+        self.validator = context.validator or ClusterValidator(context.client, context.namespace)
+        self.cleanup_keys = context.cleanup_keys
     
     def pause(self, lesson_name=None):
         """Pause for user input in interactive mode with menu options."""
@@ -25,10 +46,9 @@ class BaseLesson:
             
         if self.interactive:
             # Always validate cluster health before showing menu
-            healthy = self.validator.validate(compact=True)
+            healthy = self.validator.validate(compact=True, max_age=PAUSE_VALIDATE_TTL)
             
             if not healthy:
-                from ..ui.display import print_warning
                 print_warning("Issues detected! Please fix before continuing or press Enter to proceed anyway.")
             
             while True:
@@ -39,6 +59,16 @@ class BaseLesson:
                     # Full validation on manual request
                     self.validator.validate(compact=False)
     
+    def _put_and_meta(self, key, bins, policy=None, meta=None):
+        """Write bins and return (key, meta) with one operate() call instead of put + exists."""
+        ops_list = [ops.write(bin_name, value) for bin_name, value in bins.items()]
+        key, meta, _ = self.client.operate(key, ops_list, meta=meta, policy=policy)
+        return key, meta
+    
+    def _remove_later(self, key):
+        """Queue a record for durable deletion when the tutorial shuts down."""
+        self.cleanup_keys.append(key)
+    
     def run(self):
         """Run the lesson. Override in subclasses."""
         raise NotImplementedError("Subclasses must implement run()")
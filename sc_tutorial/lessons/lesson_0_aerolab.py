@@ -1,11 +1,36 @@
 """Lesson 0: AeroLab Setup"""
 
 from .base import BaseLesson
-from ..ui.display import print_banner, print_section, print_concept
+from ..ui.display import print_banner, print_section, print_concept, print_block
 from ..ui.colors import Colors
 from ..config import AEROLAB_SETUP, AEROLAB_MULTI_NODE
 
 
+_AEROLAB_SETUP_B = f"{Colors.DIM}{AEROLAB_SETUP}{Colors.ENDC}\n".encode('utf-8')
+_AEROLAB_MULTI_NODE_B = f"{Colors.DIM}{AEROLAB_MULTI_NODE}{Colors.ENDC}\n".encode('utf-8')
+
+_VERIFY_COMMANDS = """
+        # Check if AeroLab is installed
+        aerolab version
+        
+        # List running clusters
+        aerolab cluster list
+        
+        # Check SC is enabled on your cluster
+        docker exec aerolab-mydc_1 asinfo -v "namespace/test" | tr ';' '\\n' | grep strong
+        
+        # Expected output:
+        # strong-consistency=true
+        # strong-consistency-allow-expunge=false
+        
+        # Check roster is configured
+        docker exec aerolab-mydc_1 asinfo -v "roster:namespace=test"
+        
+        # Expected: roster=<node_id>:pending_roster=<node_id>:observed_nodes=<node_id>
+        """
+_VERIFY_COMMANDS_B = f"{Colors.DIM}{_VERIFY_COMMANDS}{Colors.ENDC}\n".encode('utf-8')
+
+
 class LessonAerolab(BaseLesson):
     """AeroLab setup instructions lesson."""
     
@@ -26,37 +51,17 @@ For SC development, AeroLab is the fastest way to get started!
         self.pause()
         
         print_section("Quick Setup (3 Commands)")
-        print(f"{Colors.DIM}{AEROLAB_SETUP}{Colors.ENDC}")
+        print_block(_AEROLAB_SETUP_B)
         
         self.pause()
         
         print_section("Multi-Node SC Cluster")
-        print(f"{Colors.DIM}{AEROLAB_MULTI_NODE}{Colors.ENDC}")
+        print_block(_AEROLAB_MULTI_NODE_B)
         
         self.pause()
         
         print_section("Verifying Your Setup")
-        
-        verify_commands = """
-        # Check if AeroLab is installed
-        aerolab version
-        
-        # List running clusters
-        aerolab cluster list
-        
-        # Check SC is enabled on your cluster
-        docker exec aerolab-mydc_1 asinfo -v "namespace/test" | tr ';' '\\n' | grep strong
-        
-        # Expected output:
-        # strong-consistency=true
-        # strong-consistency-allow-expunge=false
-        
-        # Check roster is configured
-        docker exec aerolab-mydc_1 asinfo -v "roster:namespace=test"
-        
-        # Expected: roster=<node_id>:pending_roster=<node_id>:observed_nodes=<node_id>
-        """
-        print(f"{Colors.DIM}{verify_commands}{Colors.ENDC}")
+        print_block(_VERIFY_COMMANDS_B)
         
         self.pause()
 
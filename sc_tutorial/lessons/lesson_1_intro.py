@@ -1,10 +1,25 @@
 """Lesson 1: Introduction to Strong Consistency"""
 
 from .base import BaseLesson
-from ..ui.display import print_banner, print_section, print_concept
+from ..ui.display import print_banner, print_section, print_concept, print_block
 from ..config import INTRO_TEXT
 
 
+_COMPARISON = """
+        ┌─────────────────────┬──────────────────────┬──────────────────────┐
+        │     Feature         │    AP Mode           │    SC Mode           │
+        ├─────────────────────┼──────────────────────┼──────────────────────┤
+        │ Data Consistency    │ Eventually consistent│ Strongly consistent  │
+        │ Availability        │ Higher               │ Lower (when degraded)│
+        │ Write Ordering      │ May reorder          │ Strict ordering      │
+        │ Read Guarantees     │ May see stale data   │ Always current       │
+        │ Network Partition   │ Both sides operate   │ One side unavailable │
+        │ Use Case            │ Caching, analytics   │ Transactions, finance│
+        └─────────────────────┴──────────────────────┴──────────────────────┘
+        """
+_COMPARISON_B = (_COMPARISON + "\n").encode('utf-8')
+
+
 class LessonIntroduction(BaseLesson):
     """Introduction to Strong Consistency lesson."""
     
@@ -21,19 +36,7 @@ class LessonIntroduction(BaseLesson):
         
         print_section("Comparing AP vs SC Mode")
         
-        comparison = """
-        ┌─────────────────────┬──────────────────────┬──────────────────────┐
-        │     Feature         │    AP Mode           │    SC Mode           │
-        ├─────────────────────┼──────────────────────┼──────────────────────┤
-        │ Data Consistency    │ Eventually consistent│ Strongly consistent  │
-        │ Availability        │ Higher               │ Lower (when degraded)│
-        │ Write Ordering      │ May reorder          │ Strict ordering      │
-        │ Read Guarantees     │ May see stale data   │ Always current       │
-        │ Network Partition   │ Both sides operate   │ One side unavailable │
-        │ Use Case            │ Caching, analytics   │ Transactions, finance│
-        └─────────────────────┴──────────────────────┴──────────────────────┘
-        """
-        print(comparison)
+        print_block(_COMPARISON_B)
         
         self.pause()
 
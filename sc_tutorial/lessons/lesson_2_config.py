@@ -1,24 +1,13 @@
 """Lesson 2: SC Configuration"""
 
 from .base import BaseLesson
-from ..ui.display import print_banner, print_section, print_concept, print_info, print_success
+from ..ui.display import print_banner, print_section, print_concept, print_info, print_success, print_warning, print_block
 from ..ui.colors import Colors
 from ..config import ROSTER_CONCEPT
+from ..cluster.validation import parse_namespace_info
 
 
-class LessonConfiguration(BaseLesson):
-    """SC configuration lesson."""
-    
-    lesson_name = 'configuration'
-    lesson_title = 'LESSON 2: CONFIGURING STRONG CONSISTENCY'
-    
-    def run(self):
-        """Lesson on SC configuration."""
-        print_banner(self.lesson_title)
-        
-        print_section("Step 1: Enable SC in namespace configuration")
-        
-        config_example = """
+_CONFIG_EXAMPLE = """
         # In aerospike.conf:
         
         namespace sc_namespace {
@@ -33,7 +22,37 @@ class LessonConfiguration(BaseLesson):
             }
         }
         """
-        print(f"{Colors.DIM}{config_example}{Colors.ENDC}")
+_CONFIG_EXAMPLE_B = f"{Colors.DIM}{_CONFIG_EXAMPLE}{Colors.ENDC}\n".encode('utf-8')
+
+_ROSTER_COMMANDS = """
+        # View current roster status:
+        asinfo -v "roster:namespace=sc_namespace"
+        
+        # Set roster with observed nodes:
+        asinfo -v "roster-set:namespace=sc_namespace;nodes=<node_ids>"
+        
+        # Apply the roster (trigger recluster):
+        asinfo -v "recluster:"
+        
+        # Using asadm (easier):
+        asadm> manage roster stage observed ns sc_namespace
+        asadm> manage recluster
+        """
+_ROSTER_COMMANDS_B = f"{Colors.DIM}{_ROSTER_COMMANDS}{Colors.ENDC}\n".encode('utf-8')
+
+
+class LessonConfiguration(BaseLesson):
+    """SC configuration lesson."""
+    
+    lesson_name = 'configuration'
+    lesson_title = 'LESSON 2: CONFIGURING STRONG CONSISTENCY'
+    
+    def run(self):
+        """Lesson on SC configuration."""
+        print_banner(self.lesson_title)
+        
+        print_section("Step 1: Enable SC in namespace configuration")
+        print_block(_CONFIG_EXAMPLE_B)
         
         print_concept("Key Configuration Parameters", """
 • strong-consistency true  - Enables SC mode for the namespace
@@ -49,21 +68,7 @@ class LessonConfiguration(BaseLesson):
         
         print_concept("Roster Configuration", ROSTER_CONCEPT)
         
-        roster_commands = """
-        # View current roster status:
-        asinfo -v "roster:namespace=sc_namespace"
-        
-        # Set roster with observed nodes:
-        asinfo -v "roster-set:namespace=sc_namespace;nodes=<node_ids>"
-        
-        # Apply the roster (trigger recluster):
-        asinfo -v "recluster:"
-        
-        # Using asadm (easier):
-        asadm> manage roster stage observed ns sc_namespace
-        asadm> manage recluster
-        """
-        print(f"{Colors.DIM}{roster_commands}{Colors.ENDC}")
+        print_block(_ROSTER_COMMANDS_B)
         
         self.pause()
         
@@ -87,13 +92,13 @@ class LessonConfiguration(BaseLesson):
             info_dict = self.client.info_all(f"namespace/{self.namespace}")
             
             if info_dict:
-                first_response = list(info_dict.values())[0]
+                first_response = next(iter(info_dict.values()))
                 if isinstance(first_response, tuple):
                     info = first_response[1] if first_response[0] is None else ""
                 else:
                     info = first_response
                 
-                params = dict(item.split('=') for item in info.split(';') if '=' in item)
+                params = parse_namespace_info(info)
                 
                 print(f"\n   Namespace: {self.namespace}")
                 print(f"   ├── strong-consistency: {params.get('strong-consistency', 'N/A')}")
@@ -103,6 +108,5 @@ class LessonConfiguration(BaseLesson):
                 print(f"   └── unavailable_partitions: {params.get('unavailable_partitions', 'N/A')}")
                 
         except Exception as e:
-            from ..ui.display import print_warning
             print_warning(f"Could not get cluster info: {e}")
 
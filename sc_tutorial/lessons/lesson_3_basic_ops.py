@@ -1,11 +1,42 @@
 """Lesson 3: Basic SC Operations"""
 
 from datetime import datetime
+
+from aerospike import exception as ae_exception
+from aerospike_helpers.operations import operations as ops
+
 from .base import BaseLesson
 from ..ui.display import (
     print_banner, print_section, print_concept, 
     print_info, print_success, print_warning, print_error, print_code
 )
+from ..config import DURABLE_DELETE_POLICY
+
+
+# Result code the server returns when a partition is unavailable
+_PARTITION_UNAVAILABLE = 11
+
+# (exception type, result code or None for any) -> hints shown by
+# _explain_error, checked in order. ClusterError's subclasses
+# (ClusterChangeError, InvalidNodeError, ...) carry other codes, so the
+# partition hint is gated on the code too.
+_ERROR_HINTS = (
+    (ae_exception.ClusterError, _PARTITION_UNAVAILABLE, (
+        "This partition's data is not currently accessible.",
+        "Check if nodes are missing from the cluster or roster.",
+    )),
+    (ae_exception.TimeoutError, None, (
+        "The operation timed out. Check if the cluster is healthy.",
+    )),
+    (ae_exception.RecordGenerationError, None, (
+        "The record was modified since you last read it.",
+        "Re-read the record and retry with the new generation.",
+    )),
+    (ae_exception.ForbiddenError, None, (
+        "This operation is not allowed in SC mode.",
+        "For deletes, use durable_delete=True or enable allow-expunge.",
+    )),
+)
 
 
 class LessonBasicOperations(BaseLesson):
@@ -16,9 +47,6 @@ class LessonBasicOperations(BaseLesson):
     
     def run(self):
         """Demonstrate basic SC operations."""
-        import aerospike
-        from aerospike import exception as ae_exception
-        
         print_banner(self.lesson_title)
         
         print_concept("SC Write Guarantees", """
@@ -61,11 +89,12 @@ When a write succeeds in SC mode:
             
             # Update
             print_info("\nUpdating the record...")
-            print_code(f"client.put(key, {{'balance': 1500}})")
+            print_code("client.operate(key, [ops.write('balance', 1500), ops.read('balance')])")
             
-            self.client.put(key, {'balance': 1500})
-            
-            _, meta2, fetched2 = self.client.get(key)
+            # Write and read back in one round-trip
+            _, meta2, fetched2 = self.client.operate(
+                key, [ops.write('balance', 1500), ops.read('balance')]
+            )
             print_success(f"Update successful!")
             print(f"   New balance: {fetched2.get('balance')}")
             print(f"   Generation: {meta['gen']} → {meta2['gen']}")
@@ -74,7 +103,7 @@ When a write succeeds in SC mode:
             print_info("\nCleaning up with durable delete...")
             print_code("client.remove(key, policy={'durable_delete': True})")
             try:
-                self.client.remove(key, policy={'durable_delete': True})
+                self.client.remove(key, policy=DURABLE_DELETE_POLICY)
                 print_success("Record deleted with tombstone")
             except ae_exception.AerospikeError:
                 print_warning("Delete requires durable_delete or allow-expunge enabled")
@@ -87,19 +116,11 @@ When a write succeeds in SC mode:
     
     def _explain_error(self, error):
         """Provide helpful explanation for common errors."""
-        error_str = str(error)
+        for error_type, code, hints in _ERROR_HINTS:
+            if isinstance(error, error_type) and (code is None or error.code == code):
+                for hint in hints:
+                    print_info(hint)
+                break
         
-        if 'PARTITION_UNAVAILABLE' in error_str:
-            print_info("This partition's data is not currently accessible.")
-            print_info("Check if nodes are missing from the cluster or roster.")
-        elif 'TIMEOUT' in error_str:
-            print_info("The operation timed out. Check if the cluster is healthy.")
-            if hasattr(error, 'in_doubt') and error.in_doubt:
-                print_warning("InDoubt: The write may or may not have been applied!")
-        elif 'GENERATION' in error_str:
-            print_info("The record was modified since you last read it.")
-            print_info("Re-read the record and retry with the new generation.")
-        elif 'FORBIDDEN' in error_str:
-            print_info("This operation is not allowed in SC mode.")
-            print_info("For deletes, use durable_delete=True or enable allow-expunge.")
-
+        if isinstance(error, ae_exception.TimeoutError) and getattr(error, 'in_doubt', False):
+            print_warning("InDoubt: The write may or may not have been applied!")
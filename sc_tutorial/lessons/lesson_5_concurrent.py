@@ -1,8 +1,11 @@
 """Lesson 5: Concurrent Write Ordering"""
 
 import time
-import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
+
+from aerospike import exception as ae_exception
+from aerospike_helpers.operations import operations as ops
+
 from .base import BaseLesson
 from ..ui.display import (
     print_banner, print_section, print_concept,
@@ -18,10 +21,6 @@ class LessonConcurrentWrites(BaseLesson):
     
     def run(self):
         """Demonstrate SC behavior with concurrent writes."""
-        import aerospike
-        from aerospike import exception as ae_exception
-        from aerospike_helpers.operations import operations as ops
-        
         print_banner(self.lesson_title)
         
         print_concept("Write Ordering Guarantee", """
@@ -43,7 +42,6 @@ sequential order. This means:
         increments_per_thread = 20
         results = []
         errors = []
-        lock = threading.Lock()
         
         try:
             # Initialize counter
@@ -51,34 +49,38 @@ sequential order. This means:
             print_info(f"Initialized counter to 0")
             print_info(f"Starting {num_threads} threads, each doing {increments_per_thread} increments...\n")
             
+            # Built once and shared by every worker; the client doesn't mutate it
+            ops_list = [
+                ops.increment('counter', 1),
+                ops.read('counter')
+            ]
+            
             def increment_worker(thread_id):
-                """Worker function to increment counter."""
+                """Worker function to increment counter.
+                
+                Collects into its own lists so threads never contend on a lock
+                between round-trips; the caller merges them afterwards.
+                """
+                values = []
+                failures = []
                 for i in range(increments_per_thread):
                     try:
-                        ops_list = [
-                            ops.increment('counter', 1),
-                            ops.read('counter')
-                        ]
                         _, _, result = self.client.operate(key, ops_list)
-                        
-                        with lock:
-                            results.append(result['counter'])
-                            
+                        values.append(result['counter'])
                     except ae_exception.AerospikeError as e:
-                        with lock:
-                            errors.append((thread_id, str(e)))
+                        failures.append((thread_id, str(e)))
                 
-                return thread_id
+                return values, failures
             
             # Run concurrent increments
-            start_time = time.time()
+            start_time = time.perf_counter()
             
             with ThreadPoolExecutor(max_workers=num_threads) as executor:
-                futures = [executor.submit(increment_worker, i) for i in range(num_threads)]
-                for future in as_completed(futures):
-                    future.result()
+                for values, failures in executor.map(increment_worker, range(num_threads)):
+                    results.extend(values)
+                    errors.extend(failures)
             
-            elapsed = time.time() - start_time
+            elapsed = time.perf_counter() - start_time
             
             # Verify results
             _, _, final = self.client.get(key)
@@ -99,17 +101,10 @@ sequential order. This means:
             else:
                 print_warning(f"Unique values: {unique_values} / {len(results)}")
             
-            self._safe_remove(key)
+            self._remove_later(key)
             
         except ae_exception.AerospikeError as e:
             print_error(f"Error: {e}")
         
         self.pause()
-    
-    def _safe_remove(self, key):
-        """Remove a record safely in SC mode using durable delete."""
-        try:
-            self.client.remove(key, policy={'durable_delete': True})
-        except:
-            pass
 
@@ -1,5 +1,8 @@
 """Lesson 6: Generation-based Conflict Detection"""
 
+import aerospike
+from aerospike import exception as ae_exception
+
 from .base import BaseLesson
 from ..ui.display import (
     print_banner, print_section, print_concept,
@@ -15,9 +18,6 @@ class LessonGeneration(BaseLesson):
     
     def run(self):
         """Demonstrate generation-based conflict detection."""
-        import aerospike
-        from aerospike import exception as ae_exception
-        
         print_banner(self.lesson_title)
         
         print_concept("Generation Numbers", """
@@ -40,15 +40,13 @@ This prevents lost updates in concurrent scenarios.
         
         try:
             # Initial write
-            self.client.put(key, {'value': 'initial', 'version': 1})
-            _, meta1 = self.client.exists(key)
+            _, meta1 = self._put_and_meta(key, {'value': 'initial', 'version': 1})
             gen1 = meta1['gen']
             print_info(f"Initial write completed, generation: {gen1}")
             
             # Simulate another client updating the record
             print_info("Simulating another client's update...")
-            self.client.put(key, {'value': 'updated_by_other', 'version': 2})
-            _, meta2 = self.client.exists(key)
+            _, meta2 = self._put_and_meta(key, {'value': 'updated_by_other', 'version': 2})
             gen2 = meta2['gen']
             print_info(f"Other client updated, generation: {gen2}")
             
@@ -70,20 +68,13 @@ This prevents lost updates in concurrent scenarios.
                 print_info("This prevents overwriting another client's changes.")
             
             # Show final value
-            _, _, final = self.client.get(key)
+            _, _, final = self.client.select(key, ['value'])
             print(f"\n   Final value: {final['value']} (preserved from other client)")
             
-            self._safe_remove(key)
+            self._remove_later(key)
             
         except ae_exception.AerospikeError as e:
             print_error(f"Error: {e}")
         
         self.pause()
-    
-    def _safe_remove(self, key):
-        """Remove a record safely in SC mode using durable delete."""
-        try:
-            self.client.remove(key, policy={'durable_delete': True})
-        except:
-            pass
 
@@ -1,10 +1,25 @@
 """Lesson 7: Error Handling in SC Mode"""
 
 from .base import BaseLesson
-from ..ui.display import print_banner, print_section, print_concept
+from ..ui.display import print_banner, print_section, print_concept, print_block
 from ..config import INDOUBT_CONCEPT
 
 
+_ERRORS_TABLE = """
+        ┌─────────────────────────┬────────────────────────────────────────────┐
+        │ Error                   │ Meaning                                    │
+        ├─────────────────────────┼────────────────────────────────────────────┤
+        │ PARTITION_UNAVAILABLE   │ Data partition is not accessible           │
+        │ INVALID_NODE_ERROR      │ No node available for the partition        │
+        │ TIMEOUT                 │ Operation timed out (InDoubt possible)     │
+        │ GENERATION_ERROR        │ Record was modified by another client      │
+        │ FORBIDDEN               │ Operation not allowed (e.g., cluster issue)│
+        │ FAIL_FORBIDDEN          │ Non-durable delete blocked in SC           │
+        └─────────────────────────┴────────────────────────────────────────────┘
+        """
+_ERRORS_TABLE_B = (_ERRORS_TABLE + "\n").encode('utf-8')
+
+
 class LessonErrorHandling(BaseLesson):
     """Error handling lesson."""
     
@@ -21,19 +36,7 @@ class LessonErrorHandling(BaseLesson):
         
         print_section("Common SC Errors")
         
-        errors_table = """
-        ┌─────────────────────────┬────────────────────────────────────────────┐
-        │ Error                   │ Meaning                                    │
-        ├─────────────────────────┼────────────────────────────────────────────┤
-        │ PARTITION_UNAVAILABLE   │ Data partition is not accessible           │
-        │ INVALID_NODE_ERROR      │ No node available for the partition        │
-        │ TIMEOUT                 │ Operation timed out (InDoubt possible)     │
-        │ GENERATION_ERROR        │ Record was modified by another client      │
-        │ FORBIDDEN               │ Operation not allowed (e.g., cluster issue)│
-        │ FAIL_FORBIDDEN          │ Non-durable delete blocked in SC           │
-        └─────────────────────────┴────────────────────────────────────────────┘
-        """
-        print(errors_table)
+        print_block(_ERRORS_TABLE_B)
         
         print_concept("Handling InDoubt", """
 When you receive a timeout with InDoubt=True:
@@ -1,28 +1,12 @@
 """Lesson 8: Cluster Behavior Under Failure"""
 
 from .base import BaseLesson
-from ..ui.display import print_banner, print_section, print_concept
+from ..ui.display import print_banner, print_section, print_concept, print_block
 from ..ui.colors import Colors
 from ..config import PARTITION_CONCEPT
 
 
-class LessonClusterBehavior(BaseLesson):
-    """Cluster behavior under failure lesson."""
-    
-    lesson_name = 'cluster'
-    lesson_title = 'LESSON 8: CLUSTER BEHAVIOR UNDER FAILURE'
-    
-    def run(self):
-        """Explain cluster behavior in various scenarios."""
-        print_banner(self.lesson_title)
-        
-        print_concept("Partition States", PARTITION_CONCEPT)
-        
-        self.pause()
-        
-        print_section("Failure Scenarios")
-        
-        scenarios = """
+_SCENARIOS = """
         SCENARIO 1: Single Node Failure (RF=2)
         ─────────────────────────────────────
         • All partitions remain AVAILABLE
@@ -49,13 +33,9 @@ class LessonClusterBehavior(BaseLesson):
         • Requires manual 'revive' command
         • Use commit-to-device to prevent data loss
         """
-        print(f"{Colors.DIM}{scenarios}{Colors.ENDC}")
-        
-        self.pause()
-        
-        print_section("Recovery Commands")
-        
-        commands = """
+_SCENARIOS_B = f"{Colors.DIM}{_SCENARIOS}{Colors.ENDC}\n".encode('utf-8')
+
+_RECOVERY_COMMANDS = """
         # Check partition status:
         asinfo -v "namespace/sc_namespace" | grep -E "dead|unavail"
         
@@ -68,7 +48,32 @@ class LessonClusterBehavior(BaseLesson):
         # Force recluster after changes:
         asinfo -v "recluster:"
         """
-        print(f"{Colors.DIM}{commands}{Colors.ENDC}")
+_RECOVERY_COMMANDS_B = f"{Colors.DIM}{_RECOVERY_COMMANDS}{Colors.ENDC}\n".encode('utf-8')
+
+
+class LessonClusterBehavior(BaseLesson):
+    """Cluster behavior under failure lesson."""
+    
+    lesson_name = 'cluster'
+    lesson_title = 'LESSON 8: CLUSTER BEHAVIOR UNDER FAILURE'
+    
+    def run(self):
+        """Explain cluster behavior in various scenarios."""
+        print_banner(self.lesson_title)
+        
+        print_concept("Partition States", PARTITION_CONCEPT)
+        
+        self.pause()
+        
+        print_section("Failure Scenarios")
+        
+        print_block(_SCENARIOS_B)
+        
+        self.pause()
+        
+        print_section("Recovery Commands")
+        
+        print_block(_RECOVERY_COMMANDS_B)
         
         self.pause()
 
@@ -1,20 +1,10 @@
 """Lesson 9: Best Practices"""
 
 from .base import BaseLesson
-from ..ui.display import print_banner
+from ..ui.display import print_banner, print_block
 
 
-class LessonBestPractices(BaseLesson):
-    """Best practices lesson."""
-    
-    lesson_name = 'cluster'
-    lesson_title = 'LESSON 9: BEST PRACTICES'
-    
-    def run(self):
-        """Share SC best practices."""
-        print_banner(self.lesson_title)
-        
-        practices = """
+_PRACTICES = """
         ┌────────────────────────────────────────────────────────────────────┐
         │                    SC BEST PRACTICES                               │
         ├────────────────────────────────────────────────────────────────────┤
@@ -56,7 +46,20 @@ class LessonBestPractices(BaseLesson):
         │                                                                    │
         └────────────────────────────────────────────────────────────────────┘
         """
-        print(practices)
+_PRACTICES_B = (_PRACTICES + "\n").encode('utf-8')
+
+
+class LessonBestPractices(BaseLesson):
+    """Best practices lesson."""
+    
+    lesson_name = 'cluster'
+    lesson_title = 'LESSON 9: BEST PRACTICES'
+    
+    def run(self):
+        """Share SC best practices."""
+        print_banner(self.lesson_title)
+        
+        print_block(_PRACTICES_B)
         
         self.pause()
 
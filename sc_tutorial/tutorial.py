@@ -1,34 +1,97 @@
 """Main tutorial orchestration class."""
 
+import contextlib
+import functools
+import io
+import signal
+import sys
+import time
+
 import aerospike
 from aerospike import exception as ae_exception
 
-from .config import DEFAULT_HOST, DEFAULT_PORT, DEFAULT_NAMESPACE, DEFAULT_SET, CONNECTION_TIMEOUT
+from .config import (
+    DEFAULT_HOST, DEFAULT_PORT, DEFAULT_NAMESPACE, DEFAULT_SET, CONNECTION_TIMEOUT, CONNECT_TIMEOUT,
+    MIN_CONNS_PER_NODE, MAX_CONNS_PER_NODE, DURABLE_DELETE_POLICY,
+)
 from .ui.display import (
-    print_banner, print_section, print_success, print_error, print_info, print_warning
+    print_banner, print_section, print_success, print_error, print_info, print_warning, print_block,
+    is_reading_key,
 )
 from .ui.colors import Colors
 from .ui.menu import interactive_menu
 from .cluster.validation import ClusterValidator
-from .lessons import (
-    LessonAerolab,
-    LessonIntroduction,
-    LessonConfiguration,
-    LessonBasicOperations,
-    LessonConsistency,
-    LessonConcurrentWrites,
-    LessonGeneration,
-    LessonErrorHandling,
-    LessonClusterBehavior,
-    LessonBestPractices,
-)
+from . import lessons as tutorial_lessons
+
+
+_WELCOME = """
+        Welcome to the Aerospike Strong Consistency Tutorial!
+        
+        This interactive guide will teach you:
+        
+          0. Setting Up SC with AeroLab (optional)
+          1. Introduction to Strong Consistency
+          2. Configuration and Setup
+          3. Basic SC Operations  
+          4. Consistency Levels
+          5. Concurrent Write Ordering
+          6. Optimistic Locking with Generations
+          7. Error Handling
+          8. Cluster Behavior under Failure
+          9. Best Practices
+        
+        Press Ctrl+C during a lesson to skip it, twice quickly (or at
+        a prompt) to exit.
+        """
+_WELCOME_B = f"{_WELCOME}\n".encode('utf-8')
+
+_AEROLAB_HINT = """
+  aerolab config backend -t docker
+  aerolab cluster create -n mydc -c 1 -f features.conf
+  aerolab conf sc -n mydc"""
+_AEROLAB_HINT_B = f"{Colors.DIM}{_AEROLAB_HINT}\n{Colors.ENDC}\n".encode('utf-8')
+
+_COMPLETE = """
+        Congratulations! You've completed the Strong Consistency tutorial.
+        
+        Key Takeaways:
+          ✓ SC guarantees write ordering and durability
+          ✓ Use roster to manage cluster membership
+          ✓ Session consistency is the default (and usually sufficient)
+          ✓ Use generation checks for optimistic locking
+          ✓ Handle InDoubt errors by reading to verify
+          ✓ Monitor partition health for cluster issues
+        
+        For more information:
+          • Aerospike SC Documentation: https://aerospike.com/docs/server/operations/configure/consistency
+          • Managing SC Clusters: https://aerospike.com/docs/server/operations/manage/consistency
+            """
+_COMPLETE_B = f"{_COMPLETE}\n".encode('utf-8')
+
+
+# A second Ctrl+C within this many seconds exits instead of skipping
+_DOUBLE_PRESS_WINDOW = 1.5
+
+
+class _SkipLesson(BaseException):
+    """Raised by the SIGINT handler to abandon the lesson in progress.
+    
+    Derives from BaseException so lessons' `except Exception` blocks
+    can't swallow it.
+    """
 
 
 class StrongConsistencyTutorial:
     """Interactive tutorial for Aerospike Strong Consistency."""
     
-    def __init__(self, hosts=None, namespace=DEFAULT_NAMESPACE, interactive=True):
-        """Initialize the tutorial."""
+    def __init__(self, hosts=None, namespace=DEFAULT_NAMESPACE, interactive=True,
+                 services_alternate=True):
+        """Initialize the tutorial.
+        
+        services_alternate makes the client discover peers through their
+        alternate-access addresses, which AeroLab's Docker port mappings need.
+        Turn it off for clusters reached directly to skip that info field.
+        """
         if hosts is None:
             hosts = [(DEFAULT_HOST, DEFAULT_PORT)]
         
@@ -42,17 +105,27 @@ class StrongConsistencyTutorial:
             'hosts': hosts,
             'policies': {
                 'timeout': CONNECTION_TIMEOUT,
+                # Reads are safe to retry; writes are not retried so an
+                # increment can't be applied twice behind an in-doubt error
+                'read': {'total_timeout': CONNECTION_TIMEOUT, 'max_retries': 2},
+                'write': {'total_timeout': CONNECTION_TIMEOUT, 'max_retries': 0},
             },
-            'use_services_alternate': True,
+            'connect_timeout': CONNECT_TIMEOUT,
+            'use_services_alternate': services_alternate,
+            # One client is shared by every lesson, so size its pool once here
+            'min_conns_per_node': MIN_CONNS_PER_NODE,
+            'max_conns_per_node': MAX_CONNS_PER_NODE,
         }
         
-        self.validator = None
+        # Demo record keys queued by lessons, removed in one batch on disconnect
+        self.cleanup_keys = []
+        # Monotonic time of the last Ctrl+C during a lesson
+        self._last_interrupt = None
     
     def connect(self):
         """Connect to the Aerospike cluster."""
         try:
             self.client = aerospike.client(self.config).connect()
-            self.validator = ClusterValidator(self.client, self.namespace)
             print_success(f"Connected to Aerospike cluster at {self.hosts}")
             return True
         except ae_exception.AerospikeError as e:
@@ -60,12 +133,41 @@ class StrongConsistencyTutorial:
             print_info("Make sure the Aerospike cluster is running and accessible")
             return False
     
+    @functools.cached_property
+    def validator(self):
+        """Cluster validator, built on first use after connect()."""
+        return ClusterValidator(self.client, self.namespace)
+    
     def disconnect(self):
         """Disconnect from the cluster."""
         if self.client:
+            self._remove_demo_records()
             self.client.close()
             print_info("Disconnected from Aerospike")
     
+    def _lesson_context(self):
+        """Build the context object handed to every lesson."""
+        return tutorial_lessons.LessonContext(
+            client=self.client,
+            namespace=self.namespace,
+            set_name=self.set_name,
+            interactive=self.interactive,
+            validator=self.validator,
+            cleanup_keys=self.cleanup_keys,
+        )
+    
+    def _remove_demo_records(self):
+        """Durably delete every record the lessons queued, in one batch request."""
+        if not self.cleanup_keys:
+            return
+        try:
+            self.client.batch_remove(
+                self.cleanup_keys, policy_batch_remove=DURABLE_DELETE_POLICY
+            )
+        except ae_exception.AerospikeError as e:
+            print_warning(f"Cleanup failed: {e}")
+        self.cleanup_keys.clear()
+    
     def show_cluster_status(self):
         """Display current cluster and SC status."""
         print_section("Cluster Status Check")
@@ -73,49 +175,41 @@ class StrongConsistencyTutorial:
         sc_enabled, info = self.validator.verify_sc_enabled()
         
         if isinstance(info, dict):
-            print(f"\n   Namespace: {self.namespace}")
-            if sc_enabled:
-                print_success(f"Strong Consistency: True")
-            else:
-                print_error(f"Strong Consistency: False")
-            print(f"   ├── Replication Factor: {info.get('replication_factor', 'N/A')}")
-            print(f"   ├── NS Cluster Size: {info.get('ns_cluster_size', 'N/A')}")
-            print(f"   ├── Dead Partitions: {info.get('dead_partitions', 'N/A')}")
-            print(f"   └── Unavailable Partitions: {info.get('unavailable_partitions', 'N/A')}")
+            # Assemble the status tree and write it in one go
+            buf = io.StringIO()
+            with contextlib.redirect_stdout(buf):
+                print(f"\n   Namespace: {self.namespace}")
+                if sc_enabled:
+                    print_success(f"Strong Consistency: True")
+                else:
+                    print_error(f"Strong Consistency: False")
+                print(f"   ├── Replication Factor: {info.get('replication_factor', 'N/A')}")
+                print(f"   ├── NS Cluster Size: {info.get('ns_cluster_size', 'N/A')}")
+                print(f"   ├── Dead Partitions: {info.get('dead_partitions', 'N/A')}")
+                print(f"   └── Unavailable Partitions: {info.get('unavailable_partitions', 'N/A')}")
+            sys.stdout.write(buf.getvalue())
         
         return sc_enabled
     
+    def _on_sigint(self, signum, frame):
+        """Skip the current lesson on Ctrl+C; a quick second press, or one at a prompt, quits."""
+        now = time.monotonic()
+        if is_reading_key() or (
+            self._last_interrupt is not None and now - self._last_interrupt < _DOUBLE_PRESS_WINDOW
+        ):
+            raise KeyboardInterrupt
+        self._last_interrupt = now
+        raise _SkipLesson
+    
     def run_tutorial(self, lessons=None, skip_sc_check=False):
         """Run the complete tutorial or specific lessons."""
         print_banner("AEROSPIKE STRONG CONSISTENCY TUTORIAL", '═')
-        
-        print("""
-        Welcome to the Aerospike Strong Consistency Tutorial!
-        
-        This interactive guide will teach you:
-        
-          0. Setting Up SC with AeroLab (optional)
-          1. Introduction to Strong Consistency
-          2. Configuration and Setup
-          3. Basic SC Operations  
-          4. Consistency Levels
-          5. Concurrent Write Ordering
-          6. Optimistic Locking with Generations
-          7. Error Handling
-          8. Cluster Behavior under Failure
-          9. Best Practices
-        
-        Press Ctrl+C at any time to exit.
-        """)
+        print_block(_WELCOME_B)
         
         if not self.connect():
             print_error("Cannot proceed without cluster connection.")
             print_info("\nTo set up an SC cluster with AeroLab:")
-            print(f"{Colors.DIM}")
-            print("  aerolab config backend -t docker")
-            print("  aerolab cluster create -n mydc -c 1 -f features.conf")
-            print("  aerolab conf sc -n mydc")
-            print(f"{Colors.ENDC}")
+            print_block(_AEROLAB_HINT_B)
             return
         
         try:
@@ -131,7 +225,7 @@ class StrongConsistencyTutorial:
                         try:
                             response = input(f"{Colors.BLUE}Show AeroLab setup? (y/n): {Colors.ENDC}").strip().lower()
                             if response == 'y':
-                                lesson = LessonAerolab(self.client, self.namespace, self.set_name, self.interactive)
+                                lesson = tutorial_lessons.LessonAerolab(self._lesson_context())
                                 lesson.run()
                                 print_warning("\nPlease set up an SC cluster and re-run this tutorial.")
                                 return
@@ -153,57 +247,45 @@ class StrongConsistencyTutorial:
                         elif choice == 'validate':
                             self.validator.validate(compact=False)
             
-            # Define all lessons
+            # Define all lessons (classes are imported only when selected)
             all_lessons = [
-                ('0', 'AeroLab Setup', LessonAerolab),
-                ('1', 'Introduction', LessonIntroduction),
-                ('2', 'Configuration', LessonConfiguration),
-                ('3', 'Basic Operations', LessonBasicOperations),
-                ('4', 'Consistency Levels', LessonConsistency),
-                ('5', 'Concurrent Writes', LessonConcurrentWrites),
-                ('6', 'Generation Conflicts', LessonGeneration),
-                ('7', 'Error Handling', LessonErrorHandling),
-                ('8', 'Cluster Behavior', LessonClusterBehavior),
-                ('9', 'Best Practices', LessonBestPractices),
+                ('0', 'AeroLab Setup', 'LessonAerolab'),
+                ('1', 'Introduction', 'LessonIntroduction'),
+                ('2', 'Configuration', 'LessonConfiguration'),
+                ('3', 'Basic Operations', 'LessonBasicOperations'),
+                ('4', 'Consistency Levels', 'LessonConsistency'),
+                ('5', 'Concurrent Writes', 'LessonConcurrentWrites'),
+                ('6', 'Generation Conflicts', 'LessonGeneration'),
+                ('7', 'Error Handling', 'LessonErrorHandling'),
+                ('8', 'Cluster Behavior', 'LessonClusterBehavior'),
+                ('9', 'Best Practices', 'LessonBestPractices'),
             ]
             
             # Filter lessons if specific ones requested
             if lessons:
-                all_lessons = [(num, name, cls) for num, name, cls in all_lessons if num in lessons]
+                wanted = frozenset(lessons)
+                all_lessons = [entry for entry in all_lessons if entry[0] in wanted]
             else:
                 # Skip lesson 0 by default
                 all_lessons = all_lessons[1:]
             
             # Run lessons
-            for lesson_num, lesson_name, lesson_class in all_lessons:
-                try:
-                    lesson = lesson_class(self.client, self.namespace, self.set_name, self.interactive)
-                    lesson.run()
-                except KeyboardInterrupt:
-                    print(f"\n{Colors.YELLOW}Lesson interrupted. Moving to next...{Colors.ENDC}")
-                    continue
-                except SystemExit:
-                    raise
+            context = self._lesson_context()
+            previous_handler = signal.signal(signal.SIGINT, self._on_sigint)
+            try:
+                for lesson_num, lesson_name, class_name in all_lessons:
+                    try:
+                        getattr(tutorial_lessons, class_name)(context).run()
+                    except _SkipLesson:
+                        print(f"\n{Colors.YELLOW}Lesson interrupted. Moving to next...{Colors.ENDC}")
+            finally:
+                signal.signal(signal.SIGINT, previous_handler)
             
             # Completion message
             print_banner("TUTORIAL COMPLETE!", '═')
-            print("""
-        Congratulations! You've completed the Strong Consistency tutorial.
-        
-        Key Takeaways:
-          ✓ SC guarantees write ordering and durability
-          ✓ Use roster to manage cluster membership
-          ✓ Session consistency is the default (and usually sufficient)
-          ✓ Use generation checks for optimistic locking
-          ✓ Handle InDoubt errors by reading to verify
-          ✓ Monitor partition health for cluster issues
-        
-        For more information:
-          • Aerospike SC Documentation: https://aerospike.com/docs/server/operations/configure/consistency
-          • Managing SC Clusters: https://aerospike.com/docs/server/operations/manage/consistency
-            """)
+            print_block(_COMPLETE_B)
             
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, _SkipLesson):  # _SkipLesson: pressed between lessons
             print(f"\n{Colors.YELLOW}Tutorial interrupted by user.{Colors.ENDC}")
         except SystemExit:
             pass
@@ -10,6 +10,9 @@ from .display import (
     print_warning,
     print_error,
     print_code,
+    print_block,
+    read_key,
+    is_reading_key,
     wait_for_user
 )
 from .menu import interactive_menu
@@ -24,6 +27,9 @@ __all__ = [
     'print_warning',
     'print_error',
     'print_code',
+    'print_block',
+    'read_key',
+    'is_reading_key',
     'wait_for_user',
     'interactive_menu'
 ]
@@ -1,5 +1,8 @@
 """Terminal color definitions."""
 
+import os
+import sys
+
 
 class Colors:
     """ANSI color codes for terminal output."""
@@ -13,3 +16,17 @@ class Colors:
     BOLD = '\033[1m'
     DIM = '\033[2m'
 
+
+def _color_enabled() -> bool:
+    """Colors are off for piped output and when NO_COLOR is set."""
+    if os.environ.get('NO_COLOR'):
+        return False
+    isatty = getattr(sys.stdout, 'isatty', None)
+    return bool(isatty and isatty())
+
+
+# Decided once at import so precomputed display strings are built without codes.
+if not _color_enabled():
+    for _attr in ('HEADER', 'BLUE', 'CYAN', 'GREEN', 'YELLOW', 'RED', 'ENDC', 'BOLD', 'DIM'):
+        setattr(Colors, _attr, '')
+    del _attr
@@ -1,59 +1,170 @@
 """Display helper functions for formatted terminal output."""
 
+import os
+import select
+import sys
+
+try:
+    import termios
+    import tty
+except ImportError:  # Windows
+    termios = None
+
 from .colors import Colors
 
 
+_BANNER_WIDTH = 70
+_BANNER_STYLE = f"{Colors.HEADER}{Colors.BOLD}"
+
+# Banner rule line per fill character, built on first use
+_BANNER_RULES = {}
+
+_SECTION_PREFIX = f"\n{Colors.CYAN}{Colors.BOLD}▶ "
+_SECTION_SUFFIX = f"{Colors.ENDC}\n{Colors.DIM}{'-' * 60}{Colors.ENDC}\n"
+_CONCEPT_PREFIX = f"\n{Colors.YELLOW}{Colors.BOLD}📚 "
+_CONCEPT_LINE_SEP = f"{Colors.ENDC}\n   {Colors.DIM}"
+
+_SUCCESS_PREFIX = f"{Colors.GREEN}✓ "
+_INFO_PREFIX = f"{Colors.CYAN}ℹ "
+_WARNING_PREFIX = f"{Colors.YELLOW}⚠ "
+_ERROR_PREFIX = f"{Colors.RED}✗ "
+_CODE_PREFIX = f"{Colors.DIM}  >>> "
+_LINE_END = f"{Colors.ENDC}\n"
+
+
 def print_banner(text, char='='):
     """Print a prominent banner."""
-    width = 70
-    print(f"\n{Colors.HEADER}{Colors.BOLD}{char * width}{Colors.ENDC}")
-    print(f"{Colors.HEADER}{Colors.BOLD}{text.center(width)}{Colors.ENDC}")
-    print(f"{Colors.HEADER}{Colors.BOLD}{char * width}{Colors.ENDC}\n")
+    rule = _BANNER_RULES.get(char)
+    if rule is None:
+        rule = _BANNER_RULES[char] = f"{_BANNER_STYLE}{char * _BANNER_WIDTH}{Colors.ENDC}\n"
+    sys.stdout.write(f"\n{rule}{_BANNER_STYLE}{text.center(_BANNER_WIDTH)}{_LINE_END}{rule}\n")
 
 
 def print_section(text):
     """Print a section header."""
-    print(f"\n{Colors.CYAN}{Colors.BOLD}▶ {text}{Colors.ENDC}")
-    print(f"{Colors.DIM}{'-' * 60}{Colors.ENDC}")
+    sys.stdout.write(f"{_SECTION_PREFIX}{text}{_SECTION_SUFFIX}")
 
 
 def print_concept(title, explanation):
     """Print a concept with title and explanation."""
-    print(f"\n{Colors.YELLOW}{Colors.BOLD}📚 {title}{Colors.ENDC}")
-    for line in explanation.split('\n'):
-        print(f"   {Colors.DIM}{line}{Colors.ENDC}")
+    body = _CONCEPT_LINE_SEP.join(explanation.split('\n'))
+    sys.stdout.write(f"{_CONCEPT_PREFIX}{title}{Colors.ENDC}\n   {Colors.DIM}{body}{_LINE_END}")
 
 
 def print_success(text):
     """Print a success message."""
-    print(f"{Colors.GREEN}✓ {text}{Colors.ENDC}")
+    sys.stdout.write(f"{_SUCCESS_PREFIX}{text}{_LINE_END}")
 
 
 def print_info(text):
     """Print an info message."""
-    print(f"{Colors.CYAN}ℹ {text}{Colors.ENDC}")
+    sys.stdout.write(f"{_INFO_PREFIX}{text}{_LINE_END}")
 
 
 def print_warning(text):
     """Print a warning message."""
-    print(f"{Colors.YELLOW}⚠ {text}{Colors.ENDC}")
+    sys.stdout.write(f"{_WARNING_PREFIX}{text}{_LINE_END}")
 
 
 def print_error(text):
     """Print an error message."""
-    print(f"{Colors.RED}✗ {text}{Colors.ENDC}")
+    sys.stdout.write(f"{_ERROR_PREFIX}{text}{_LINE_END}")
 
 
 def print_code(code):
     """Print code/command."""
-    print(f"{Colors.DIM}  >>> {code}{Colors.ENDC}")
+    sys.stdout.write(f"{_CODE_PREFIX}{code}{_LINE_END}")
+
+
+def print_block(data):
+    """Print a pre-encoded UTF-8 block of static text.
+    
+    When stdout is piped (e.g. --non-interactive in CI) the bytes go straight
+    to the file descriptor in one write, skipping the text-layer encode and
+    buffering. On a terminal it falls back to sys.stdout.write.
+    """
+    try:
+        fd = sys.stdout.fileno()
+    except (AttributeError, OSError, ValueError):
+        fd = None
+    
+    if fd is None or sys.stdout.isatty():
+        sys.stdout.write(data.decode('utf-8'))
+        return
+    
+    sys.stdout.flush()
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+# True while read_key() waits for input, so a SIGINT handler can tell a
+# prompt apart from running code
+_reading_key = False
+
+
+def is_reading_key():
+    """Return True while read_key() is waiting for input."""
+    return _reading_key
+
+
+def read_key(prompt):
+    """Prompt for a single keypress and return it lowercased.
+    
+    Enter returns '' and an arrow or other escape-sequence key returns
+    '\x1b'; other keys, whitespace included, come back as typed. When stdin
+    isn't a terminal (piped input, CI) this falls back to reading a whole
+    line with input().
+    """
+    global _reading_key
+    _reading_key = True
+    try:
+        return _read_key(prompt)
+    finally:
+        _reading_key = False
+
+
+def _read_key(prompt):
+    """Read one key (or a line when stdin is not a terminal) for read_key()."""
+    if termios is None or not sys.stdin.isatty():
+        return input(prompt).strip().lower()
+    
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    fd = sys.stdin.fileno()
+    old_attrs = termios.tcgetattr(fd)
+    try:
+        tty.setcbreak(fd)  # Ctrl+C still raises KeyboardInterrupt
+        data = os.read(fd, 1)
+        # Arrow and function keys arrive as several bytes at once; take the
+        # whole sequence so its tail isn't read as further keypresses
+        while data and select.select([fd], [], [], 0)[0]:
+            chunk = os.read(fd, 64)
+            if not chunk:
+                break
+            data += chunk
+        termios.tcflush(fd, termios.TCIFLUSH)
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_attrs)
+    
+    key = data.decode('utf-8', errors='replace')
+    if key in ('', '\x04'):  # Ctrl+D
+        sys.stdout.write('\n')
+        raise EOFError
+    if key.startswith('\x1b'):  # Escape sequence: never a menu choice
+        sys.stdout.write('\n')
+        return '\x1b'
+    key = key.rstrip('\r\n').lower()
+    sys.stdout.write(f"{key}\n")  # cbreak mode doesn't echo
+    return key
 
 
 def wait_for_user(message="Press Enter to continue..."):
     """Wait for user input."""
     try:
-        input(f"\n{Colors.BLUE}{message}{Colors.ENDC}")
+        read_key(f"\n{Colors.BLUE}{message}{Colors.ENDC}")
+    except EOFError:
+        pass
     except KeyboardInterrupt:
         print(f"\n{Colors.YELLOW}Tutorial interrupted by user.{Colors.ENDC}")
         raise SystemExit(0)
-
@@ -1,47 +1,73 @@
 """Interactive menu system for the tutorial."""
 
+import sys
+
 from .colors import Colors
-from ..cluster.shell import open_aql_shell, open_asadm_shell, detect_aerolab_container
+from .display import read_key
+from ..cluster.shell import open_aql_shell, open_asadm_shell
+from ..cluster.validation import invalidate_sc_info_cache
 from ..commands.suggested import show_suggested_commands
 
+# Menu text is built once at import, after colors.py has applied NO_COLOR/isatty
+_MENU_BAR = f"{Colors.BOLD}{'═'*60}{Colors.ENDC}"
+_MENU_BLOCK = '\n'.join((
+    f"\n{_MENU_BAR}",
+    f"{Colors.BOLD}  What would you like to do?{Colors.ENDC}",
+    _MENU_BAR,
+    f"  {Colors.GREEN}[Enter]{Colors.ENDC} Continue to next section",
+    f"  {Colors.CYAN}[a]{Colors.ENDC}     Open AQL shell (query/insert data)",
+    f"  {Colors.CYAN}[s]{Colors.ENDC}     Open ASADM shell (admin commands)",
+    f"  {Colors.YELLOW}[v]{Colors.ENDC}     Validate cluster health",
+    f"  {Colors.RED}[q]{Colors.ENDC}     Quit tutorial",
+    _MENU_BAR,
+)) + '\n'
+_MENU_PROMPT = f"{Colors.BLUE}Enter choice [Enter/a/s/v/q]: {Colors.ENDC}"
+
+# Cursor up N lines, then clear to the end of the screen
+_ERASE_PROMPT = '\x1b[1A\x1b[J'
+_ERASE_PROMPT_AND_ERROR = '\x1b[2A\x1b[J'
+
 
 def interactive_menu(lesson_name='basic_ops', namespace='test'):
     """Display interactive menu and handle user choice."""
-    container = detect_aerolab_container()
-    
     # Only show suggested commands after configuration lessons (lesson 3+)
     # Skip for setup/intro/configuration lessons
     skip_commands = lesson_name in ['aerolab', 'introduction', 'configuration']
     if not skip_commands:
         show_suggested_commands(lesson_name)
     
+    # On a terminal, invalid keys rewrite only the prompt and error lines
+    rewind = sys.stdout.isatty()
+    redraw = True
+    error_shown = False
     while True:
-        print(f"\n{Colors.BOLD}{'═'*60}{Colors.ENDC}")
-        print(f"{Colors.BOLD}  What would you like to do?{Colors.ENDC}")
-        print(f"{Colors.BOLD}{'═'*60}{Colors.ENDC}")
-        print(f"  {Colors.GREEN}[Enter]{Colors.ENDC} Continue to next section")
-        print(f"  {Colors.CYAN}[a]{Colors.ENDC}     Open AQL shell (query/insert data)")
-        print(f"  {Colors.CYAN}[s]{Colors.ENDC}     Open ASADM shell (admin commands)")
-        print(f"  {Colors.YELLOW}[v]{Colors.ENDC}     Validate cluster health")
-        print(f"  {Colors.RED}[q]{Colors.ENDC}     Quit tutorial")
-        print(f"{Colors.BOLD}{'═'*60}{Colors.ENDC}")
+        if redraw:
+            sys.stdout.write(_MENU_BLOCK)
+            redraw = False
+            error_shown = False
         
         try:
-            choice = input(f"{Colors.BLUE}Enter choice [Enter/a/s/v/q]: {Colors.ENDC}").strip().lower()
+            choice = read_key(_MENU_PROMPT)
         except KeyboardInterrupt:
             print(f"\n{Colors.YELLOW}Tutorial interrupted.{Colors.ENDC}")
             raise SystemExit(0)
         except EOFError:
             return 'continue'
         
+        # Word aliases ('aql', 'quit', ...) only arrive in line mode, when
+        # stdin isn't a terminal; a TTY prompt returns after one key
         if choice in ['', 'c', 'continue']:
             return 'continue'
         elif choice in ['a', 'aql', '1']:
-            open_aql_shell(container, namespace)
+            open_aql_shell(namespace=namespace)  # Detects (and caches) the container
+            redraw = True
+            invalidate_sc_info_cache()  # Cluster state may have changed in the shell
             if not skip_commands:
                 show_suggested_commands(lesson_name)  # Show commands again after returning
         elif choice in ['s', 'asadm', '2']:
-            open_asadm_shell(container)
+            open_asadm_shell()
+            redraw = True
+            invalidate_sc_info_cache()  # Cluster state may have changed in the shell
             if not skip_commands:
                 show_suggested_commands(lesson_name)  # Show commands again after returning
         elif choice in ['v', 'validate', '3']:
@@ -50,5 +76,10 @@ def interactive_menu(lesson_name='basic_ops', namespace='test'):
             print(f"{Colors.YELLOW}Exiting tutorial...{Colors.ENDC}")
             raise SystemExit(0)
         else:
+            if rewind:
+                sys.stdout.write(_ERASE_PROMPT_AND_ERROR if error_shown else _ERASE_PROMPT)
+                error_shown = True
+            else:
+                redraw = True
             print(f"{Colors.RED}Invalid choice. Please enter a, s, v, q or just press Enter.{Colors.ENDC}")
 